@@ -0,0 +1,120 @@
+import numpy as np
+import pandas as pd
+
+
+# Posibles alias (ya normalizados) de cada campo del master
+PN_ALIASES = ["pn", "partnumber", "material", "codigo", "codigomaterial", "materialcode"]
+UBI_ALIASES = ["ubicaciones", "ubicacion", "location", "ubicacionessap", "ubicacionfisica"]
+DESC_ALIASES = ["descripcion", "description", "desc"]
+
+# Enteros de float64 representables sin perder dígitos
+_MAX_ENTERO_EXACTO = 2 ** 53
+
+
+def normalizar_encabezados(columnas) -> pd.Series:
+    """
+    Normaliza nombres de columnas: minúsculas, sin tildes, sin espacios ni signos.
+    Las cabeceras que no son texto quedan como NA.
+    """
+    s = pd.Series(list(columnas), dtype=object)
+    # Sin ninguna cabecera de texto (p. ej. la primera fila son números) el
+    # accesor .str no acepta la serie: las que no son texto pasan a NA antes
+    s = s.where(s.map(lambda c: isinstance(c, str)))
+    return (
+        s.astype("string").str.strip()
+        .str.lower()
+        .str.normalize("NFKD")
+        .str.encode("ascii", errors="ignore")
+        .str.decode("ascii")
+        .str.replace(r"[\s\-_./]", "", regex=True)
+    )
+
+
+def _numeros_a_texto(serie: pd.Series) -> pd.Series:
+    """Números de Excel a texto: 5802889562.0 -> "5802889562", 1.5 -> "1.5"."""
+    if pd.api.types.is_integer_dtype(serie) and not serie.hasnans:
+        return pd.Series(serie.to_numpy().astype(str), index=serie.index, dtype=object)
+
+    valores = serie.to_numpy(dtype="float64", na_value=np.nan)
+    presentes = ~np.isnan(valores)
+    entero = presentes & (valores % 1 == 0) & (np.abs(valores) < _MAX_ENTERO_EXACTO)
+    resto = presentes & ~entero
+
+    # Formatear float -> str es lo caro: solo lo hacemos con los que no son enteros
+    texto = np.full(len(valores), None, dtype=object)
+    texto[entero] = valores[entero].astype(np.int64).astype(str)
+    texto[resto] = valores[resto].astype(str)
+    return pd.Series(texto, index=serie.index, dtype=object)
+
+
+def _limpiar_valores(serie: pd.Series) -> pd.Series:
+    if pd.api.types.is_bool_dtype(serie):
+        return serie.astype(str)
+    if pd.api.types.is_numeric_dtype(serie):
+        return _numeros_a_texto(serie)
+
+    # Columna mixta, como la devuelve openpyxl: texto y números.
+    # Los números se formatean aparte; strip solo sobre las celdas de texto.
+    tipos = serie.map(type)
+    numericas = tipos.isin((int, float))
+    texto = serie.where(~numericas)
+
+    otras = texto.notna() & (tipos != str)
+    if otras.any():
+        texto[otras] = texto[otras].astype(str)
+
+    texto = texto.str.strip()
+    if numericas.any():
+        texto[numericas] = _numeros_a_texto(serie[numericas].astype("float64"))
+    return texto
+
+
+def limpiar_texto(serie: pd.Series) -> pd.Series:
+    """
+    Convierte una columna del Excel a texto sin espacios sobrantes.
+    Las celdas vacías quedan como "" (nunca como el literal "nan").
+    """
+    # El master repite mucho PN, ubicaciones y descripciones: limpiamos cada
+    # valor distinto una sola vez y lo expandimos con los códigos.
+    codigos, unicos = pd.factorize(serie)
+    limpios = _limpiar_valores(pd.Series(unicos)).fillna("").to_numpy(dtype=object)
+    limpios = np.append(limpios, "")  # el código -1 (celda vacía) cae en este ""
+    return pd.Series(limpios[codigos], index=serie.index, dtype=object)
+
+
+def normalizar_master(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Deja el Excel crudo como un frame (pn, ubicacion, descripcion) limpio y sin duplicados.
+    Lanza ValueError si faltan las columnas de PN o Ubicaciones.
+    """
+    encabezados = normalizar_encabezados(df.columns)
+    cols_map = {}
+    for norm, original in zip(encabezados, df.columns):
+        if isinstance(norm, str):
+            cols_map[norm] = original
+
+    def pick(cands):
+        for k in cands:
+            if k in cols_map:
+                return cols_map[k]
+        return None
+
+    col_pn = pick(PN_ALIASES)
+    col_ubi = pick(UBI_ALIASES)
+    col_des = pick(DESC_ALIASES)
+
+    if not col_pn or not col_ubi:
+        raise ValueError(f"Faltan columnas PN o Ubicaciones. Encabezados: {list(df.columns)}")
+
+    out = pd.DataFrame({
+        "pn": limpiar_texto(df[col_pn]),
+        "ubicacion": limpiar_texto(df[col_ubi]),
+        "descripcion": (
+            limpiar_texto(df[col_des]) if col_des
+            else pd.Series("", index=df.index, dtype=object)
+        ),
+    })
+
+    out = out[(out["pn"] != "") & (out["ubicacion"] != "")]
+    out = out.drop_duplicates(subset=["pn", "ubicacion"], keep="last")
+    return out.reset_index(drop=True)
@@ -0,0 +1,81 @@
+import csv
+import gzip
+import io
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from app_inventario.models import CountDetail, CountSession, ResultSnapshot, SesionArchivada
+from app_inventario.views.informes import _escribir_csv_sesion
+
+
+class Command(BaseCommand):
+    help = (
+        "Archiva las sesiones de conteo más viejas que la retención: guarda su CSV comprimido "
+        "en SesionArchivada, deja un resumen en ResultSnapshot y borra la sesión y su detalle."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dias",
+            type=int,
+            default=settings.ARCHIVO_RETENCION_DIAS,
+            help="Archiva sesiones creadas hace más de N días",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Solo informa qué se archivaría, sin modificar la base",
+        )
+
+    def handle(self, *args, **options):
+        limite = timezone.now() - timedelta(days=options["dias"])
+        session_ids = list(
+            CountSession.objects.filter(creado_en__lt=limite)
+            .order_by("creado_en")
+            .values_list("id", flat=True)
+        )
+        n_detalles = CountDetail.objects.filter(session_id__in=session_ids).count()
+
+        self.stdout.write(self.style.NOTICE(
+            f"Sesiones anteriores a {limite:%Y-%m-%d}: {len(session_ids)} ({n_detalles} filas de detalle)"
+        ))
+        if options["dry_run"] or not session_ids:
+            return
+
+        for session_id in session_ids:
+            # Una transacción por sesión: si algo falla, esa sesión queda intacta
+            with transaction.atomic():
+                session = CountSession.objects.select_for_update().get(id=session_id)
+
+                buf = io.StringIO()
+                total, revisadas = _escribir_csv_sesion(csv.writer(buf, delimiter=';'), session)
+                porcentaje = round(revisadas / total * 100, 1) if total else 0.0
+
+                SesionArchivada.objects.create(
+                    session_id=session.id,
+                    pn=session.pn,
+                    operador=session.operador,
+                    comentario=session.comentario,
+                    creado_en=session.creado_en,
+                    total=total,
+                    revisadas=revisadas,
+                    csv_gz=gzip.compress(buf.getvalue().encode("utf-8")),
+                )
+                snapshot = ResultSnapshot.objects.create(
+                    pn=session.pn,
+                    total=total,
+                    revisadas=revisadas,
+                    porcentaje=porcentaje,
+                )
+                # created_at es auto_now_add: lo llevamos a la fecha de la sesión,
+                # no a la del archivado
+                ResultSnapshot.objects.filter(pk=snapshot.pk).update(created_at=session.creado_en)
+                session.delete()  # CASCADE borra sus CountDetail
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Archivadas {len(session_ids)} sesiones, {n_detalles} filas de detalle liberadas"
+        ))
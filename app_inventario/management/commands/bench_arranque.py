@@ -0,0 +1,59 @@
+import re
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+# Lo que hace un worker al arrancar: settings, app WSGI y URLconf (que importa las vistas)
+SCRIPT = """
+import os, resource, sys, time
+t0 = time.perf_counter()
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+from django.core.wsgi import get_wsgi_application
+get_wsgi_application()
+from django.urls import get_resolver
+get_resolver().url_patterns
+ms = (time.perf_counter() - t0) * 1000
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+pesados = [m for m in ("pandas", "numpy", "reportlab", "openpyxl") if m in sys.modules]
+print(f"RESULTADO {ms:.0f} {rss:.1f} {','.join(pesados) or '-'}")
+"""
+
+
+class Command(BaseCommand):
+    help = (
+        "Mide el arranque de un worker en un intérprete nuevo (python -X importtime): "
+        "tiempo, memoria máxima y qué dependencias pesadas quedaron cargadas."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeticiones", type=int, default=5)
+        parser.add_argument("--top", type=int, default=10, help="Módulos más lentos a mostrar")
+
+    def handle(self, *args, **options):
+        tiempos, rss, pesados, importtime = [], [], "-", ""
+        for _ in range(options["repeticiones"]):
+            proc = subprocess.run(
+                [sys.executable, "-X", "importtime", "-c", SCRIPT],
+                cwd=settings.BASE_DIR,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            ms, mb, pesados = proc.stdout.split("RESULTADO ")[1].split()
+            tiempos.append(float(ms))
+            rss.append(float(mb))
+            importtime = proc.stderr
+
+        tiempos.sort()
+        self.stdout.write(self.style.SUCCESS(
+            f"Arranque: mediana {tiempos[len(tiempos) // 2]:.0f} ms | "
+            f"memoria máx {max(rss):.1f} MB | dependencias pesadas cargadas: {pesados}"
+        ))
+
+        # Líneas "import time: self | cumulative | módulo" de la última corrida
+        filas = re.findall(r"import time:\s+\d+ \|\s+(\d+) \| *(\S+)", importtime)
+        propios = [(int(us), mod) for us, mod in filas if mod.split(".")[0] in ("app_inventario", "config")]
+        for us, mod in sorted(propios, reverse=True)[: options["top"]]:
+            self.stdout.write(f"{us / 1000:8.1f} ms  {mod}")
@@ -0,0 +1,80 @@
+import statistics
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.urls import reverse
+
+from app_inventario.models import CountSession, LocationBase
+
+BENCH_PN = "__bench__"
+CSRF_TOKEN = "b" * 32
+
+
+class Command(BaseCommand):
+    help = (
+        "Prueba de carga de los endpoints del checklist contra un servidor ya levantado "
+        "(gunicorn WSGI o ASGI) que use la misma base. Reporta taps/segundo y latencias."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--url", default="http://127.0.0.1:8000", help="URL base del servidor")
+        parser.add_argument("--endpoint", choices=["toggle_check", "actualizar_cantidad"], default="toggle_check")
+        parser.add_argument("--requests", type=int, default=2000)
+        parser.add_argument("--concurrencia", type=int, default=32, help="Operadores simultáneos")
+        parser.add_argument("--ubicaciones", type=int, default=200)
+
+    def _tap(self, url, data):
+        body = urllib.parse.urlencode(data).encode()
+        req = urllib.request.Request(url, data=body, method="POST", headers={
+            "Content-Type": "application/x-www-form-urlencoded",
+            "Cookie": f"{settings.CSRF_COOKIE_NAME}={CSRF_TOKEN}",
+            "X-CSRFToken": CSRF_TOKEN,
+        })
+        t0 = time.perf_counter()
+        try:
+            with urllib.request.urlopen(req, timeout=30) as resp:
+                ok = resp.status == 200
+        except (urllib.error.URLError, TimeoutError):
+            ok = False
+        return ok, (time.perf_counter() - t0) * 1000
+
+    def handle(self, *args, **options):
+        LocationBase.objects.filter(pn=BENCH_PN).delete()
+        LocationBase.objects.bulk_create(
+            LocationBase(pn=BENCH_PN, ubicacion=f"B{i:04d}") for i in range(options["ubicaciones"])
+        )
+        base_ids = list(LocationBase.objects.filter(pn=BENCH_PN).values_list("id", flat=True))
+        session = CountSession.objects.create(pn=BENCH_PN, operador="bench")
+
+        url = options["url"].rstrip("/") + reverse(options["endpoint"])
+        payloads = []
+        for i in range(options["requests"]):
+            data = {"session_id": session.id, "base_id": base_ids[i % len(base_ids)]}
+            if options["endpoint"] == "toggle_check":
+                data["checked"] = "true" if i % 2 == 0 else "false"
+            else:
+                data["cantidad"] = str(i % 10)
+            payloads.append(data)
+
+        try:
+            t0 = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=options["concurrencia"]) as pool:
+                resultados = list(pool.map(lambda d: self._tap(url, d), payloads))
+            total = time.perf_counter() - t0
+        finally:
+            CountSession.objects.filter(pn=BENCH_PN).delete()
+            LocationBase.objects.filter(pn=BENCH_PN).delete()
+
+        latencias = sorted(ms for _, ms in resultados)
+        errores = sum(1 for ok, _ in resultados if not ok)
+        p95 = latencias[int(len(latencias) * 0.95) - 1] if latencias else 0.0
+        self.stdout.write(self.style.SUCCESS(
+            f"{url} | concurrencia {options['concurrencia']} | "
+            f"{len(resultados) / total:.0f} taps/s | {errores} errores | "
+            f"p50 {statistics.median(latencias):.1f} ms | p95 {p95:.1f} ms"
+        ))
@@ -0,0 +1,61 @@
+import time
+
+import numpy as np
+import pandas as pd
+from django.core.management.base import BaseCommand
+
+from app_inventario.limpieza import normalizar_master
+
+
+def _limpieza_anterior(df: pd.DataFrame) -> pd.DataFrame:
+    """Limpieza previa (astype(str) + filtro por ""), solo como referencia."""
+    df = df.rename(columns={"PN": "pn", "Ubicaciones": "ubicacion", "Descripción": "descripcion"})
+    df["pn"] = df["pn"].astype(str).str.strip()
+    df["ubicacion"] = df["ubicacion"].astype(str).str.strip()
+    df["descripcion"] = df["descripcion"].astype(str).fillna("").str.strip()
+    df = df[(df["pn"] != "") & (df["ubicacion"] != "")]
+    df = df.dropna(subset=["pn", "ubicacion"])
+    return df.drop_duplicates(subset=["pn", "ubicacion"], keep="last")
+
+
+class Command(BaseCommand):
+    help = "Mide el tiempo de limpieza del master con un Excel sintético de N filas (no toca la base)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--filas", type=int, default=1_000_000)
+        parser.add_argument("--repeticiones", type=int, default=3)
+
+    def _generar(self, n: int) -> pd.DataFrame:
+        rng = np.random.default_rng(0)
+        # Como llega de openpyxl: PN numéricos mezclados con texto, celdas vacías.
+        # Cardinalidades proporcionales a ubicaciones_relevar.xlsx (~18 filas por PN,
+        # ~4 por ubicación).
+        pns = rng.integers(5_800_000_000, 5_810_000_000, max(n // 18, 1))
+        pn = rng.choice(pns, n).astype(object)
+        pn[rng.random(n) < 0.2] = "ABC-123 "
+        pn[rng.random(n) < 0.01] = np.nan
+        ubi = pd.Series(rng.integers(0, max(n // 4, 1), n)).map("U{:06d}".format).astype(object)
+        ubi[rng.random(n) < 0.01] = np.nan
+        desc = np.full(n, " Descripción del material ", dtype=object)
+        desc[rng.random(n) < 0.3] = np.nan
+        return pd.DataFrame({"PN": pn, "Ubicaciones": ubi.to_numpy(), "Descripción": desc})
+
+    def _medir(self, fn, df, repeticiones):
+        tiempos = []
+        for _ in range(repeticiones):
+            t0 = time.perf_counter()
+            out = fn(df.copy())
+            tiempos.append(time.perf_counter() - t0)
+        return min(tiempos), out
+
+    def handle(self, *args, **options):
+        n = options["filas"]
+        df = self._generar(n)
+        self.stdout.write(f"Filas sintéticas: {n:,}")
+
+        for nombre, fn in (("anterior", _limpieza_anterior), ("normalizar_master", normalizar_master)):
+            t, out = self._medir(fn, df, options["repeticiones"])
+            basura = int((out["pn"] == "nan").sum() + (out["ubicacion"] == "nan").sum())
+            self.stdout.write(
+                f"{nombre:>18}: {t:.3f}s | filas resultantes {len(out):,} | celdas 'nan' importadas {basura:,}"
+            )
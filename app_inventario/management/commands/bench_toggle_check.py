@@ -0,0 +1,90 @@
+import statistics
+import time
+
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import RequestFactory
+from django.urls import reverse
+
+from app_inventario.models import CountSession, LocationBase
+
+BENCH_PN = "__bench__"
+CSRF_TOKEN = "b" * 32
+
+
+class Command(BaseCommand):
+    help = (
+        "Mide la latencia por request de toggle_check pasando por el handler WSGI completo "
+        "(abre/reusa/cierra conexiones igual que gunicorn). Correrlo con distintos "
+        "DB_CONN_MAX_AGE / DB_POOL para comparar."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=300)
+        parser.add_argument("--ubicaciones", type=int, default=50)
+        parser.add_argument(
+            "--pausa-ms",
+            type=int,
+            default=0,
+            help="Espera entre requests, para simular operadores con el sistema inactivo",
+        )
+
+    def handle(self, *args, **options):
+        db = settings.DATABASES["default"]
+        self.stdout.write(
+            f"Motor: {db['ENGINE']} | CONN_MAX_AGE={db.get('CONN_MAX_AGE', 0)} | "
+            f"health checks={db.get('CONN_HEALTH_CHECKS', False)} | "
+            f"pool={'pool' in db.get('OPTIONS', {})}"
+        )
+
+        LocationBase.objects.filter(pn=BENCH_PN).delete()
+        LocationBase.objects.bulk_create(
+            LocationBase(pn=BENCH_PN, ubicacion=f"B{i:04d}") for i in range(options["ubicaciones"])
+        )
+        base_ids = list(LocationBase.objects.filter(pn=BENCH_PN).values_list("id", flat=True))
+        session = CountSession.objects.create(pn=BENCH_PN, operador="bench")
+        # El handler cierra las conexiones al terminar cada request, igual que en producción
+        connection.close()
+
+        handler = WSGIHandler()
+        factory = RequestFactory()
+        url = reverse("toggle_check")
+        latencias = []
+        errores = 0
+
+        try:
+            for i in range(options["requests"]):
+                environ = factory.post(
+                    url,
+                    {
+                        "session_id": session.id,
+                        "base_id": base_ids[i % len(base_ids)],
+                        "checked": "true" if i % 2 == 0 else "false",
+                    },
+                    HTTP_HOST="localhost",
+                    HTTP_COOKIE=f"{settings.CSRF_COOKIE_NAME}={CSRF_TOKEN}",
+                    HTTP_X_CSRFTOKEN=CSRF_TOKEN,
+                ).environ
+
+                t0 = time.perf_counter()
+                response = handler(environ, lambda status, headers: None)
+                response.close()  # dispara request_finished → close_old_connections
+                latencias.append((time.perf_counter() - t0) * 1000)
+
+                if response.status_code != 200:
+                    errores += 1
+                if options["pausa_ms"]:
+                    time.sleep(options["pausa_ms"] / 1000)
+        finally:
+            CountSession.objects.filter(pn=BENCH_PN).delete()
+            LocationBase.objects.filter(pn=BENCH_PN).delete()
+
+        latencias.sort()
+        p95 = latencias[int(len(latencias) * 0.95) - 1] if latencias else 0.0
+        self.stdout.write(self.style.SUCCESS(
+            f"{len(latencias)} requests ({errores} con error) | "
+            f"media {statistics.mean(latencias):.2f} ms | "
+            f"p50 {statistics.median(latencias):.2f} ms | p95 {p95:.2f} ms"
+        ))
@@ -1,19 +1,26 @@
 from pathlib import Path
 
 from django.core.management.base import BaseCommand, CommandError
-import pandas as pd
 
-from app_inventario.views import _import_df_to_locationbase
+from app_inventario.master_excel import guardar_locationbase, leer_cache, leer_master
 
 
 class Command(BaseCommand):
-    help = "Importa el Excel base (PN / Ubicaciones / Descripción) en LocationBase."
+    help = (
+        "Importa el Excel base (PN / Ubicaciones / Descripción) en LocationBase. "
+        "También acepta directamente un .npz de la caché."
+    )
 
     def add_arguments(self, parser):
         parser.add_argument(
             "file_path",
             type=str,
-            help="Ruta al archivo .xlsx con el master de ubicaciones",
+            help="Ruta al archivo .xlsx con el master de ubicaciones (o a un .npz de la caché)",
+        )
+        parser.add_argument(
+            "--sin-cache",
+            action="store_true",
+            help="Parsea el Excel aunque ya exista en la caché (y no la actualiza)",
         )
 
     def handle(self, *args, **options):
@@ -25,13 +32,15 @@ class Command(BaseCommand):
         self.stdout.write(self.style.NOTICE(f"Leyendo archivo: {file_path}"))
 
         try:
-            # 👇 SIN chunksize: versión compatible con tu pandas
-            df = pd.read_excel(file_path, engine="openpyxl")
+            if file_path.suffix.lower() == ".npz":
+                df = leer_cache(file_path)
+            else:
+                df = leer_master(file_path, usar_cache=not options["sin_cache"])
         except Exception as e:
-            raise CommandError(f"No se pudo leer el Excel: {e}")
+            raise CommandError(f"No se pudo leer el archivo: {e}")
 
         try:
-            filas = _import_df_to_locationbase(df)
+            filas = guardar_locationbase(df)
         except Exception as e:
             raise CommandError(f"Error importando a LocationBase: {e}")
 
@@ -0,0 +1,129 @@
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from django.conf import settings
+from django.db import transaction
+
+from .limpieza import normalizar_master
+from .models import LocationBase
+
+
+def guardar_locationbase(df: pd.DataFrame) -> int:
+    """Reemplaza LocationBase con el contenido de un frame ya normalizado."""
+    objs = [
+        LocationBase(pn=pn, ubicacion=ubicacion, descripcion=descripcion, activo=True)
+        for pn, ubicacion, descripcion in zip(df["pn"], df["ubicacion"], df["descripcion"])
+    ]
+
+    with transaction.atomic():
+        LocationBase.objects.all().delete()
+        LocationBase.objects.bulk_create(objs, batch_size=1000)
+
+    return len(objs)
+
+
+# ========= Caché columnar del Excel =========
+# Parsear el .xlsx con openpyxl es lo más lento de cada importación.
+# Guardamos el frame ya normalizado en un .npz (texto UTF-8 + largos por
+# columna) indexado por el SHA-256 del archivo, así reimportar el mismo
+# Excel no vuelve a parsearlo.
+
+CACHE_VERSION = 2
+CACHE_COLS = ("pn", "ubicacion", "descripcion")
+
+
+def _hash_archivo(archivo) -> str:
+    """SHA-256 de un archivo subido (UploadedFile) o de una ruta en disco."""
+    h = hashlib.sha256()
+    if hasattr(archivo, "chunks"):
+        for chunk in archivo.chunks():
+            h.update(chunk)
+        archivo.seek(0)
+    else:
+        with open(archivo, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                h.update(chunk)
+    return h.hexdigest()
+
+
+def _ruta_cache(digest: str) -> Path:
+    return Path(settings.EXCEL_CACHE_DIR) / f"{digest}.v{CACHE_VERSION}.npz"
+
+
+def _guardar_cache(df: pd.DataFrame, ruta: Path) -> None:
+    arrays = {}
+    for col in CACHE_COLS:
+        encoded = [v.encode("utf-8") for v in df[col]]
+        arrays[f"{col}_len"] = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+        arrays[f"{col}_buf"] = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+
+    ruta.parent.mkdir(parents=True, exist_ok=True)
+    # Cada escritura usa su propio temporal y después un rename atómico: aunque dos
+    # workers importen el mismo archivo a la vez, nadie ve un .npz a medias
+    with tempfile.NamedTemporaryFile(dir=ruta.parent, prefix=".tmp-", suffix=".npz", delete=False) as tmp:
+        try:
+            np.savez_compressed(tmp, **arrays)
+        except BaseException:
+            tmp.close()
+            os.unlink(tmp.name)
+            raise
+    os.replace(tmp.name, ruta)
+    _podar_cache(ruta.parent)
+
+
+def _podar_cache(carpeta: Path) -> None:
+    """Borra cachés de otra CACHE_VERSION y deja solo las EXCEL_CACHE_MAX más recientes."""
+    vigentes = []
+    for f in carpeta.glob("*.v*.npz"):
+        try:
+            if f.name.endswith(f".v{CACHE_VERSION}.npz"):
+                vigentes.append((f.stat().st_mtime, f))
+            else:
+                f.unlink()
+        except FileNotFoundError:
+            pass  # otro worker la borró mientras podábamos
+
+    vigentes.sort(reverse=True)
+    for _, f in vigentes[settings.EXCEL_CACHE_MAX:]:
+        f.unlink(missing_ok=True)
+
+
+def leer_cache(ruta) -> pd.DataFrame:
+    """Lee un .npz generado por _guardar_cache y devuelve el frame normalizado."""
+    cols = {}
+    with np.load(ruta, allow_pickle=False) as data:
+        for col in CACHE_COLS:
+            buf = data[f"{col}_buf"].tobytes()
+            ends = np.cumsum(data[f"{col}_len"]).tolist()
+            starts = [0] + ends[:-1]
+            cols[col] = [buf[a:b].decode("utf-8") for a, b in zip(starts, ends)]
+    return pd.DataFrame(cols, columns=list(CACHE_COLS))
+
+
+def leer_master(archivo, usar_cache: bool = True) -> pd.DataFrame:
+    """
+    Devuelve el master normalizado (pn, ubicacion, descripcion).
+    Si el mismo archivo ya se importó antes, sale de la caché sin parsear el Excel.
+    """
+    if not usar_cache:
+        return normalizar_master(pd.read_excel(archivo, engine="openpyxl"))
+
+    ruta = _ruta_cache(_hash_archivo(archivo))
+    if ruta.exists():
+        try:
+            df = leer_cache(ruta)
+            os.utime(ruta)  # la poda conserva las más usadas recientemente
+            return df
+        except Exception:
+            pass  # caché corrupta: la regeneramos abajo
+
+    df = normalizar_master(pd.read_excel(archivo, engine="openpyxl"))
+    try:
+        _guardar_cache(df, ruta)
+    except OSError:
+        pass  # sin disco escribible seguimos igual, solo sin caché
+    return df
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app_inventario', '0004_countdetail_cantidad'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='countdetail',
+            name='id_operacion',
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+    ]
@@ -0,0 +1,29 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app_inventario', '0005_countdetail_id_operacion'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SesionArchivada',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('session_id', models.IntegerField(unique=True)),
+                ('pn', models.CharField(db_index=True, max_length=50)),
+                ('operador', models.CharField(max_length=100)),
+                ('comentario', models.TextField(blank=True, null=True)),
+                ('creado_en', models.DateTimeField()),
+                ('archivado_en', models.DateTimeField(auto_now_add=True)),
+                ('total', models.IntegerField()),
+                ('revisadas', models.IntegerField()),
+                ('csv_gz', models.BinaryField()),
+            ],
+            options={
+                'ordering': ['-creado_en'],
+            },
+        ),
+    ]
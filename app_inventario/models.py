@@ -41,6 +41,8 @@ class CountDetail(models.Model):
     fecha_revision = models.DateTimeField(blank=True, null=True)
     # 👉 NUEVO: cantidad de piezas encontradas en esa ubicación
     cantidad = models.IntegerField(blank=True, null=True)
+    # op_id del último tap aplicado (lo manda el cliente y lo repite en los reintentos)
+    id_operacion = models.CharField(max_length=64, blank=True, null=True)
 
     class Meta:
         unique_together = ('session', 'base')
@@ -58,3 +60,22 @@ class ResultSnapshot(models.Model):
 
     def __str__(self):
         return f"{self.pn} | {self.porcentaje}% | {self.created_at.strftime('%Y-%m-%d %H:%M')}"
+
+
+class SesionArchivada(models.Model):
+    """
+    Sesión vieja sacada de CountSession/CountDetail por el comando archivar_sesiones.
+    El detalle queda como el mismo CSV que exporta la sesión, comprimido con gzip.
+    """
+    session_id = models.IntegerField(unique=True)
+    pn = models.CharField(max_length=50, db_index=True)
+    operador = models.CharField(max_length=100)
+    comentario = models.TextField(blank=True, null=True)
+    creado_en = models.DateTimeField()
+    archivado_en = models.DateTimeField(auto_now_add=True)
+    total = models.IntegerField()
+    revisadas = models.IntegerField()
+    csv_gz = models.BinaryField()
+
+    class Meta:
+        ordering = ['-creado_en']
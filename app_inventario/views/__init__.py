@@ -0,0 +1,29 @@
+# Vistas separadas por funcionalidad. pandas/numpy (importación del Excel) y
+# ReportLab (PDF) se importan dentro de las vistas que los usan, así arrancar
+# un worker o correr un comando liviano no paga su carga.
+from .checklist import actualizar_cantidad, toggle_check
+from .importacion import cargar_excel
+from .informes import (
+    comparar_sesiones,
+    exportar_comparacion_csv,
+    exportar_sesion_archivada_csv,
+    exportar_sesion_csv,
+    informe_sesion,
+)
+from .material import buscar_material, historial_pn, listado_ubicaciones
+from .pdf import exportar_listado_pdf
+
+__all__ = [
+    "actualizar_cantidad",
+    "buscar_material",
+    "cargar_excel",
+    "comparar_sesiones",
+    "exportar_comparacion_csv",
+    "exportar_listado_pdf",
+    "exportar_sesion_archivada_csv",
+    "exportar_sesion_csv",
+    "historial_pn",
+    "informe_sesion",
+    "listado_ubicaciones",
+    "toggle_check",
+]
@@ -0,0 +1,94 @@
+import uuid
+
+from django.db import IntegrityError, connection
+from django.http import JsonResponse
+from django.utils import timezone
+
+from ..models import CountDetail
+
+
+# Las vistas del checklist son sync a propósito. Bajo ASGI (config/asgi.py)
+# Django corre cada request sync en su propio hilo, así que un tap que espera a
+# la base tampoco bloquea al worker; y bajo WSGI se ahorran el salto
+# async_to_sync que pagaría una vista async.
+#
+# Cada tap es un único INSERT ... ON CONFLICT (session, base) DO UPDATE que
+# escribe solo el campo tocado. La existencia de la sesión y la ubicación la
+# validan las FK.
+#
+# El cliente manda un op_id por tap y lo repite en sus reintentos. El UPDATE
+# solo se aplica si la fila no tiene ya ese op_id, así reenviar el último tap
+# no toca nada (ni siquiera fecha_revision). Un reintento de un tap más viejo
+# que el último aplicado sí se aplica: la página encola los taps de cada fila
+# para que eso no pase con sus propios reintentos.
+
+def _upsert_sql(session_id, base_id, id_operacion, campos):
+    """Ejecuta el upsert. Devuelve False si era un reintento de la última operación."""
+    qn = connection.ops.quote_name
+    tabla = qn(CountDetail._meta.db_table)
+
+    valores = {"revisado": False, "fecha_revision": None, "cantidad": None, **campos}
+    if valores["fecha_revision"] is not None:
+        valores["fecha_revision"] = connection.ops.adapt_datetimefield_value(valores["fecha_revision"])
+    columnas = ["session_id", "base_id", *valores, "id_operacion"]
+    actualizar = [*campos, "id_operacion"]
+
+    sql = (
+        f"INSERT INTO {tabla} ({', '.join(qn(c) for c in columnas)}) "
+        f"VALUES ({', '.join(['%s'] * len(columnas))}) "
+        f"ON CONFLICT ({qn('session_id')}, {qn('base_id')}) DO UPDATE SET "
+        + ", ".join(f"{qn(c)} = EXCLUDED.{qn(c)}" for c in actualizar)
+        + f" WHERE {tabla}.{qn('id_operacion')} IS DISTINCT FROM EXCLUDED.{qn('id_operacion')}"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [session_id, base_id, *valores.values(), id_operacion])
+        return cursor.rowcount > 0
+
+
+def _upsert_detalle(request, **campos):
+    try:
+        session_id = int(request.POST.get("session_id", ""))
+        base_id = int(request.POST.get("base_id", ""))
+    except ValueError:
+        return JsonResponse({"success": False, "error": "Parámetros inválidos"}, status=400)
+
+    # Sin op_id del cliente, el tap es una operación nueva
+    id_operacion = request.POST.get("op_id", "").strip()[:64] or uuid.uuid4().hex
+
+    try:
+        aplicada = _upsert_sql(session_id, base_id, id_operacion, campos)
+    except IntegrityError:
+        # La FK rechazó la sesión o la ubicación
+        return JsonResponse({"success": False, "error": "Sesión o ubicación inexistente"}, status=404)
+
+    return JsonResponse({"success": True, "op_id": id_operacion, "duplicada": not aplicada})
+
+
+def toggle_check(request):
+    """Marca/desmarca una ubicación dentro de una sesión."""
+    if request.method == "POST":
+        checked = request.POST.get("checked") == "true"
+        return _upsert_detalle(
+            request,
+            revisado=checked,
+            fecha_revision=timezone.now() if checked else None,
+        )
+    return JsonResponse({"success": False}, status=400)
+
+
+def actualizar_cantidad(request):
+    """Actualiza la cantidad contada para una ubicación en una sesión."""
+    if request.method == "POST":
+        cantidad_raw = request.POST.get("cantidad", "").strip()
+
+        if cantidad_raw == "":
+            cantidad = None
+        else:
+            try:
+                cantidad = int(cantidad_raw)
+            except ValueError:
+                return JsonResponse({"success": False, "error": "Cantidad inválida"}, status=400)
+
+        return _upsert_detalle(request, cantidad=cantidad)
+
+    return JsonResponse({"success": False}, status=400)
@@ -0,0 +1,20 @@
+from django.contrib import messages
+from django.shortcuts import redirect, render
+
+
+def cargar_excel(request):
+    """Subir Excel desde la web y actualizar LocationBase."""
+    if request.method == "POST" and request.FILES.get("archivo"):
+        # pandas/numpy se cargan recién acá, no al arrancar cada worker
+        from ..master_excel import guardar_locationbase, leer_master
+
+        try:
+            df = leer_master(request.FILES["archivo"])
+            n = guardar_locationbase(df)
+            messages.success(request, f"Archivo importado correctamente. Filas procesadas: {n}.")
+            return redirect("buscar_material")
+        except Exception as e:
+            messages.error(request, f"Error al importar: {e}")
+            return redirect("cargar_excel")
+
+    return render(request, "app_inventario/cargar_excel.html")
@@ -0,0 +1,251 @@
+import csv
+import gzip
+
+from django.contrib import messages
+from django.db.models import BooleanField, Case, Count, F, FilteredRelation, Max, Min, Q, Sum, Value, When
+from django.http import HttpResponse
+from django.shortcuts import get_object_or_404, redirect, render
+
+from ..models import CountDetail, CountSession, LocationBase, SesionArchivada
+
+
+def informe_sesion(request, session_id):
+    """Informe detallado de una sesión de conteo."""
+    session = get_object_or_404(CountSession, id=session_id)
+    pn = session.pn
+
+    base_ubics = list(LocationBase.objects.filter(pn=pn, activo=True).order_by("ubicacion"))
+    detalles = CountDetail.objects.filter(session=session)
+    detalles_by_base = {d.base_id: d for d in detalles}
+
+    rows = []
+    total = len(base_ubics)
+    revisadas = 0
+    for b in base_ubics:
+        detalle = detalles_by_base.get(b.id)
+        if detalle and detalle.revisado:
+            revisadas += 1
+        rows.append({"base": b, "detalle": detalle})
+
+    porcentaje = round(revisadas / total * 100, 1) if total else 0.0
+
+    return render(request, "app_inventario/informe_sesion.html", {
+        "session": session,
+        "pn": pn,
+        "rows": rows,
+        "total": total,
+        "revisadas": revisadas,
+        "porcentaje": porcentaje,
+    })
+
+
+def _escribir_csv_sesion(writer, session):
+    """Escribe el detalle de una sesión en un csv.writer. Devuelve (total, revisadas)."""
+    pn = session.pn
+
+    base_ubics = list(LocationBase.objects.filter(pn=pn, activo=True).order_by("ubicacion"))
+    detalles = CountDetail.objects.filter(session=session)
+    detalles_by_base = {d.base_id: d for d in detalles}
+
+    writer.writerow([
+        "PN",
+        "Operador",
+        "Fecha sesión",
+        "Ubicación",
+        "Descripción",
+        "Revisado",
+        "Cantidad",
+        "Fecha revisión",
+        "Comentario sesión",
+    ])
+
+    revisadas = 0
+    for b in base_ubics:
+        detalle = detalles_by_base.get(b.id)
+        if detalle and detalle.revisado:
+            revisadas += 1
+        writer.writerow([
+            pn,
+            session.operador,
+            session.creado_en.strftime("%Y-%m-%d %H:%M"),
+            b.ubicacion,
+            b.descripcion,
+            "SI" if (detalle and detalle.revisado) else "NO",
+            detalle.cantidad if (detalle and detalle.cantidad is not None) else "",
+            detalle.fecha_revision.strftime("%Y-%m-%d %H:%M") if (detalle and detalle.fecha_revision) else "",
+            session.comentario or "",
+        ])
+
+    return len(base_ubics), revisadas
+
+
+def exportar_sesion_csv(request, session_id):
+    """Exporta a CSV una sesión de conteo."""
+    session = get_object_or_404(CountSession, id=session_id)
+
+    filename = f"avance_{session.pn}_sesion_{session.id}.csv"
+    response = HttpResponse(content_type="text/csv")
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+
+    _escribir_csv_sesion(csv.writer(response, delimiter=';'), session)
+    return response
+
+
+def exportar_sesion_archivada_csv(request, session_id):
+    """Descarga el CSV guardado de una sesión ya archivada."""
+    archivada = get_object_or_404(SesionArchivada, session_id=session_id)
+
+    filename = f"avance_{archivada.pn}_sesion_{archivada.session_id}.csv"
+    response = HttpResponse(gzip.decompress(archivada.csv_gz), content_type="text/csv")
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
+
+
+# ========= Comparación de sesiones =========
+
+def _sesiones_a_comparar(request, pn):
+    """Sesiones elegidas con ?s=ID&s=ID..., de la más vieja a la más nueva."""
+    ids = [int(x) for x in request.GET.getlist("s") if x.isdigit()]
+    return list(CountSession.objects.filter(pn=pn, id__in=ids).order_by("creado_en", "id"))
+
+
+def _comparacion_sesiones(pn, sesiones, solo_diferencias=False):
+    """
+    Compara N sesiones de un PN. Todo se calcula en SQL con agregados
+    condicionales sobre LEFT JOIN LocationBase → CountDetail, con el JOIN
+    restringido a las sesiones elegidas (no recorre los demás conteos del PN):
+    - una consulta con una fila por ubicación (revisado / cantidad por sesión
+      y delta de cantidad contra la primera sesión)
+    - una consulta con los totales por sesión
+    """
+    ids = [s.id for s in sesiones]
+    n = len(sesiones)
+    ubicaciones = (
+        LocationBase.objects
+        .filter(pn=pn, activo=True)
+        .annotate(sel=FilteredRelation("conteos", condition=Q(conteos__session_id__in=ids)))
+    )
+
+    por_sesion = {}
+    for i, sid in enumerate(ids):
+        por_sesion[f"rev_{i}"] = Count("sel", filter=Q(sel__session_id=sid, sel__revisado=True))
+        por_sesion[f"cant_{i}"] = Max("sel__cantidad", filter=Q(sel__session_id=sid))
+
+    qs = (
+        ubicaciones
+        .annotate(
+            **por_sesion,
+            revisadas_en=Count("sel", filter=Q(sel__revisado=True)),
+            con_cantidad=Count("sel", filter=Q(sel__cantidad__isnull=False)),
+            cant_min=Min("sel__cantidad"),
+            cant_max=Max("sel__cantidad"),
+        )
+        .annotate(
+            **{f"delta_{i}": F(f"cant_{i}") - F("cant_0") for i in range(1, n)},
+            # Revisada en unas sesiones y en otras no, cantidad cargada solo en
+            # algunas, o cantidades distintas entre sesiones
+            diferencia=Case(
+                When(
+                    Q(revisadas_en__gt=0, revisadas_en__lt=n)
+                    | Q(con_cantidad__gt=0, con_cantidad__lt=n)
+                    | Q(cant_max__gt=F("cant_min")),
+                    then=Value(True),
+                ),
+                default=Value(False),
+                output_field=BooleanField(),
+            ),
+        )
+        .order_by("ubicacion")
+    )
+    if solo_diferencias:
+        qs = qs.filter(diferencia=True)
+
+    rows = []
+    for r in qs.values():
+        rows.append({
+            "ubicacion": r["ubicacion"],
+            "descripcion": r["descripcion"],
+            "sesiones": [
+                {"revisado": r[f"rev_{i}"] > 0, "cantidad": r[f"cant_{i}"]}
+                for i in range(n)
+            ],
+            "deltas": [r[f"delta_{i}"] for i in range(1, n)],
+            "diferencia": r["diferencia"],
+        })
+
+    agregados = {"total": Count("id", distinct=True)}
+    for i, sid in enumerate(ids):
+        agregados[f"rev_{i}"] = Count("sel", filter=Q(sel__session_id=sid, sel__revisado=True))
+        agregados[f"cant_{i}"] = Sum("sel__cantidad", filter=Q(sel__session_id=sid))
+    t = ubicaciones.aggregate(**agregados)
+
+    totales = [
+        {"session": s, "revisadas": t[f"rev_{i}"], "cantidad": t[f"cant_{i}"] or 0}
+        for i, s in enumerate(sesiones)
+    ]
+    for tot in totales[1:]:
+        tot["delta"] = tot["cantidad"] - totales[0]["cantidad"]
+
+    return rows, totales, t["total"]
+
+
+def comparar_sesiones(request, pn):
+    """Compara dos o más sesiones de un PN, ubicación por ubicación."""
+    sesiones = _sesiones_a_comparar(request, pn)
+    if len(sesiones) < 2:
+        messages.error(request, "Seleccioná al menos dos sesiones para comparar.")
+        return redirect("historial_pn", pn=pn)
+
+    solo_diferencias = request.GET.get("solo_diferencias") == "1"
+    rows, totales, total = _comparacion_sesiones(pn, sesiones, solo_diferencias)
+
+    return render(request, "app_inventario/comparar_sesiones.html", {
+        "pn": pn,
+        "sesiones": sesiones,
+        "rows": rows,
+        "totales": totales,
+        "total": total,
+        "solo_diferencias": solo_diferencias,
+        "query_sesiones": "&".join(f"s={s.id}" for s in sesiones),
+    })
+
+
+def exportar_comparacion_csv(request, pn):
+    """Exporta a CSV la comparación de sesiones de un PN."""
+    sesiones = _sesiones_a_comparar(request, pn)
+    if len(sesiones) < 2:
+        messages.error(request, "Seleccioná al menos dos sesiones para comparar.")
+        return redirect("historial_pn", pn=pn)
+
+    solo_diferencias = request.GET.get("solo_diferencias") == "1"
+    rows, totales, _ = _comparacion_sesiones(pn, sesiones, solo_diferencias)
+    ref = sesiones[0]
+
+    filename = f"comparacion_{pn}_" + "_".join(str(s.id) for s in sesiones) + ".csv"
+    response = HttpResponse(content_type="text/csv")
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+
+    writer = csv.writer(response, delimiter=';')
+    header = ["PN", "Ubicación", "Descripción"]
+    for s in sesiones:
+        header += [f"Revisado #{s.id}", f"Cantidad #{s.id}"]
+    header += [f"Delta #{s.id} vs #{ref.id}" for s in sesiones[1:]]
+    header.append("Diferencia")
+    writer.writerow(header)
+
+    for r in rows:
+        fila = [pn, r["ubicacion"], r["descripcion"]]
+        for c in r["sesiones"]:
+            fila += ["SI" if c["revisado"] else "NO", "" if c["cantidad"] is None else c["cantidad"]]
+        fila += ["" if d is None else d for d in r["deltas"]]
+        fila.append("SI" if r["diferencia"] else "NO")
+        writer.writerow(fila)
+
+    fila = [pn, "TOTAL", ""]
+    for tot in totales:
+        fila += [tot["revisadas"], tot["cantidad"]]
+    fila += [tot["delta"] for tot in totales[1:]]
+    fila.append("")
+    writer.writerow(fila)
+
+    return response
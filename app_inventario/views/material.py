@@ -0,0 +1,105 @@
+from django.contrib import messages
+from django.shortcuts import get_object_or_404, redirect, render
+from django.urls import reverse
+
+from ..models import CountDetail, CountSession, LocationBase, SesionArchivada
+
+
+def buscar_material(request):
+    query = request.GET.get("q", "").strip()
+    materiales = []
+
+    if query:
+        materiales = (
+            LocationBase.objects
+            .filter(pn__icontains=query, activo=True)
+            .values("pn")
+            .distinct()
+            .order_by("pn")
+        )
+
+    return render(request, "app_inventario/buscar_material.html", {
+        "query": query,
+        "materiales": materiales,
+    })
+
+
+def listado_ubicaciones(request, pn):
+    """
+    - Si es POST: crea una nueva CountSession para ese PN.
+    - Si es GET:
+        - Sin ?session= → muestra formulario para crear sesión y listado de sesiones previas.
+        - Con ?session=ID → muestra checklist para esa sesión.
+    """
+    # Crear nueva sesión
+    if request.method == "POST":
+        operador = request.POST.get("operador", "").strip()
+        comentario = request.POST.get("comentario", "").strip()
+        if not operador:
+            messages.error(request, "Debe ingresar el nombre del operador.")
+        else:
+            session = CountSession.objects.create(
+                pn=pn,
+                operador=operador,
+                comentario=comentario,
+            )
+            return redirect(f"{reverse('listado_ubicaciones', args=[pn])}?session={session.id}")
+
+    session_id = request.GET.get("session")
+    sesiones_pn = CountSession.objects.filter(pn=pn).order_by("-creado_en")
+
+    session = None
+    rows = []
+    total = revisadas = 0
+
+    if session_id:
+        session = get_object_or_404(CountSession, id=session_id, pn=pn)
+        base_ubics = list(LocationBase.objects.filter(pn=pn, activo=True).order_by("ubicacion"))
+        detalles = CountDetail.objects.filter(session=session)
+        detalles_by_base = {d.base_id: d for d in detalles}
+
+        for b in base_ubics:
+            detalle = detalles_by_base.get(b.id)
+            rows.append({"base": b, "detalle": detalle})
+            if detalle and detalle.revisado:
+                revisadas += 1
+
+        total = len(base_ubics)
+
+    porcentaje = round(revisadas / total * 100, 1) if total else 0.0
+
+    return render(request, "app_inventario/listado_ubicaciones.html", {
+        "pn": pn,
+        "session": session,
+        "sesiones_pn": sesiones_pn,
+        "rows": rows,
+        "total": total,
+        "revisadas": revisadas,
+        "porcentaje": porcentaje,
+    })
+
+
+def historial_pn(request, pn):
+    """Historial de sesiones para un PN, con avance calculado."""
+    sesiones = CountSession.objects.filter(pn=pn).order_by("-creado_en")
+
+    data = []
+    for s in sesiones:
+        base_ubics = LocationBase.objects.filter(pn=pn, activo=True)
+        total = base_ubics.count()
+        revisadas = CountDetail.objects.filter(session=s, revisado=True).count()
+        porcentaje = round(revisadas / total * 100, 1) if total else 0.0
+        data.append({
+            "session": s,
+            "total": total,
+            "revisadas": revisadas,
+            "porcentaje": porcentaje,
+        })
+
+    archivadas = SesionArchivada.objects.filter(pn=pn).defer("csv_gz")
+
+    return render(request, "app_inventario/historial_pn.html", {
+        "pn": pn,
+        "data": data,
+        "archivadas": archivadas,
+    })
@@ -0,0 +1,68 @@
+from django.http import HttpResponse
+
+from ..models import LocationBase
+
+
+def exportar_listado_pdf(request, pn):
+    """
+    Genera un PDF con el listado de ubicaciones para un PN,
+    para imprimir y completar a mano.
+    NO depende de una sesión de conteo.
+    """
+    # ReportLab se carga solo cuando alguien pide el PDF
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import mm
+    from reportlab.pdfgen import canvas
+
+    # Traemos todas las ubicaciones activas de ese PN
+    base_ubics = LocationBase.objects.filter(pn=pn, activo=True).order_by("ubicacion")
+
+    # Armamos la respuesta HTTP como PDF
+    filename = f"listado_{pn}.pdf"
+    response = HttpResponse(content_type="application/pdf")
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+
+    # Configuramos ReportLab
+    c = canvas.Canvas(response, pagesize=A4)
+    width, height = A4
+
+    # Margenes
+    left = 20 * mm
+    top = height - 20 * mm
+    line_height = 8 * mm
+
+    # Título
+    c.setFont("Helvetica-Bold", 14)
+    c.drawString(left, top, f"Listado de ubicaciones para PN {pn}")
+
+    y = top - 2 * line_height
+
+    # Encabezados de columnas
+    c.setFont("Helvetica-Bold", 10)
+    c.drawString(left, y, "Ok")
+    c.drawString(left + 20 * mm, y, "Ubicación")
+    c.drawString(left + 70 * mm, y, "Descripción")
+    c.drawString(left + 150 * mm, y, "Cantidad")
+    y -= line_height
+
+    c.setFont("Helvetica", 10)
+
+    for b in base_ubics:
+        if y < 20 * mm:  # salto de página
+            c.showPage()
+            y = top
+
+        # Cuadradito para "Ok"
+        c.rect(left, y - 3, 5 * mm, 5 * mm)
+
+        c.drawString(left + 20 * mm, y, b.ubicacion[:20])
+        c.drawString(left + 70 * mm, y, (b.descripcion or "")[:40])
+        # Dejo espacio en blanco para escribir la cantidad
+        # solo una línea vacía
+        c.line(left + 150 * mm, y - 2, left + 190 * mm, y - 2)
+
+        y -= line_height
+
+    c.showPage()
+    c.save()
+    return response
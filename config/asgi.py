@@ -0,0 +1,7 @@
+import os
+from django.core.asgi import get_asgi_application
+os.environ.setdefault("DJANGO_SETTINGS_MODULE","config.settings")
+# Bajo ASGI cada request corre en su propio hilo y las conexiones persistentes
+# no se reutilizan: sin esto quedarían abiertas hasta CONN_MAX_AGE
+os.environ.setdefault("DB_CONN_MAX_AGE","0")
+application=get_asgi_application()
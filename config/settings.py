@@ -18,14 +18,61 @@ CSRF_TRUSTED_ORIGINS = ["https://*.onrender.com"]
 # ================= BASE DE DATOS =================
 # - Si existe DATABASE_URL → usa Postgres (Render)
 # - Si NO existe → usa SQLite local
+#
+# Ajustes de conexión para Postgres (todos por variable de entorno):
+# - DB_CONN_MAX_AGE: segundos que se reutiliza una conexión persistente (0 = una por request)
+# - DB_CONN_HEALTH_CHECKS: verifica la conexión persistente antes de reusarla, así
+#   una conexión cortada por Render tras un rato inactivo no termina en un 500
+# - DB_CONNECT_TIMEOUT: segundos máximos para abrir la conexión
+# - DB_STATEMENT_TIMEOUT_MS: corta consultas colgadas del lado de Postgres (0 = sin límite)
+# - DB_POOL=1: pool de conexiones nativo de Django (requiere Django >= 5.1 y
+#   psycopg 3: pip install "psycopg[binary,pool]"); reemplaza a las conexiones persistentes
+#
+# Bajo ASGI las conexiones persistentes no se reutilizan entre requests:
+# config/asgi.py deja DB_CONN_MAX_AGE=0 por defecto (o usar DB_POOL=1).
+
+DB_CONN_MAX_AGE = int(os.environ.get("DB_CONN_MAX_AGE", "600"))
+DB_CONN_HEALTH_CHECKS = os.environ.get("DB_CONN_HEALTH_CHECKS", "1") == "1"
+DB_CONNECT_TIMEOUT = int(os.environ.get("DB_CONNECT_TIMEOUT", "5"))
+DB_STATEMENT_TIMEOUT_MS = int(os.environ.get("DB_STATEMENT_TIMEOUT_MS", "15000"))
+DB_POOL = os.environ.get("DB_POOL", "0") == "1"
 
 if "DATABASE_URL" in os.environ:
     DATABASES = {
         "default": dj_database_url.config(
-            conn_max_age=600,
+            conn_max_age=DB_CONN_MAX_AGE,
+            conn_health_checks=DB_CONN_HEALTH_CHECKS,
             ssl_require=False,  # si Render exige SSL se puede pasar a True
         )
     }
+
+    db_options = DATABASES["default"].setdefault("OPTIONS", {})
+    db_options["connect_timeout"] = DB_CONNECT_TIMEOUT
+    if DB_STATEMENT_TIMEOUT_MS:
+        db_options["options"] = f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}"
+
+    if DB_POOL:
+        import django
+        from django.core.exceptions import ImproperlyConfigured
+
+        try:
+            import psycopg_pool  # noqa: F401
+        except ImportError:
+            psycopg_pool = None
+        if django.VERSION < (5, 1) or psycopg_pool is None:
+            raise ImproperlyConfigured(
+                'DB_POOL=1 requiere Django >= 5.1 y psycopg 3 con pool '
+                '(pip install "psycopg[binary,pool]"). Con las versiones de '
+                'requirements.txt usar DB_CONN_MAX_AGE + DB_CONN_HEALTH_CHECKS.'
+            )
+
+        # Con pool, Django no admite CONN_MAX_AGE > 0: el pool ya reutiliza las conexiones
+        DATABASES["default"]["CONN_MAX_AGE"] = 0
+        db_options["pool"] = {
+            "min_size": int(os.environ.get("DB_POOL_MIN", "1")),
+            "max_size": int(os.environ.get("DB_POOL_MAX", "4")),
+            "timeout": int(os.environ.get("DB_POOL_TIMEOUT", "10")),
+        }
 else:
     DATABASES = {
         "default": {
@@ -34,6 +81,19 @@ else:
         }
     }
 
+# ================= CACHÉ DEL EXCEL =================
+# Frames ya normalizados del master (.npz), indexados por hash del archivo.
+# Reimportar el mismo Excel los usa en lugar de volver a parsear el .xlsx.
+
+EXCEL_CACHE_DIR = Path(os.environ.get("EXCEL_CACHE_DIR", BASE_DIR / "cache_excel"))
+# Cuántos Excel distintos se guardan; los menos usados se borran al escribir uno nuevo
+EXCEL_CACHE_MAX = int(os.environ.get("EXCEL_CACHE_MAX", "5"))
+
+# ================= ARCHIVO DE SESIONES =================
+# manage.py archivar_sesiones mueve las sesiones más viejas que esto a SesionArchivada
+
+ARCHIVO_RETENCION_DIAS = int(os.environ.get("ARCHIVO_RETENCION_DIAS", "180"))
+
 # ================= APPS =================
 
 INSTALLED_APPS = [
@@ -78,6 +138,9 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = "config.wsgi.application"
+# Modo ASGI (cada request en su propio hilo, sin bloquear workers):
+#   gunicorn config.asgi:application -k uvicorn_worker.UvicornWorker
+ASGI_APPLICATION = "config.asgi.application"
 
 # ================= ESTÁTICOS =================
 
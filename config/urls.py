@@ -14,6 +14,12 @@ urlpatterns = [
     # Trabajo sobre PN
     path("material/<str:pn>/", views.listado_ubicaciones, name="listado_ubicaciones"),
     path("material/<str:pn>/historial/", views.historial_pn, name="historial_pn"),
+    path("material/<str:pn>/comparar/", views.comparar_sesiones, name="comparar_sesiones"),
+    path(
+        "material/<str:pn>/comparar/exportar-csv/",
+        views.exportar_comparacion_csv,
+        name="exportar_comparacion_csv",
+    ),
 
     # Informes de sesión
     path("sesion/<int:session_id>/informe/", views.informe_sesion, name="informe_sesion"),
@@ -22,6 +28,11 @@ urlpatterns = [
         views.exportar_sesion_csv,
         name="exportar_sesion_csv",
     ),
+    path(
+        "sesion/<int:session_id>/archivada/exportar-csv/",
+        views.exportar_sesion_archivada_csv,
+        name="exportar_sesion_archivada_csv",
+    ),
 
     # NUEVOS endpoints (Ajax + PDF)
     path("api/toggle-check/", views.toggle_check, name="toggle_check"),